@@ -3,21 +3,41 @@ from django.contrib import admin
 from .models import Asset, Notification, Violation
 
 
+class ChangelistDeferMixin:
+    """
+    Defers ``changelist_defer`` fields on the changelist, which never
+    shows them; change forms load the whole row in one query.
+    """
+    changelist_defer = ()
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name.endswith('_changelist'):
+            queryset = queryset.defer(*self.changelist_defer)
+        return queryset
+
+
 @admin.register(Asset)
-class AssetAdmin(admin.ModelAdmin):
+class AssetAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = ['name', 'service_time', 'expiration_time', 'is_serviced', 'is_expired', 'created_at']
     list_filter = ['is_serviced', 'created_at']
     search_fields = ['name', 'description']
     readonly_fields = ['created_at', 'updated_at']
+    changelist_defer = ['description']
 
 @admin.register(Notification)
-class NotificationAdmin(admin.ModelAdmin):
+class NotificationAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = ['asset', 'notification_type', 'sent_at']
+    list_select_related = ['asset']
     list_filter = ['notification_type', 'sent_at']
     search_fields = ['asset__name', 'message']
+    changelist_defer = ['message', 'asset__description']
 
 @admin.register(Violation)
-class ViolationAdmin(admin.ModelAdmin):
+class ViolationAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = ['asset', 'violation_type', 'created_at']
+    list_select_related = ['asset']
     list_filter = ['violation_type', 'created_at']
     search_fields = ['asset__name', 'description']
+    changelist_defer = ['description', 'asset__description']
@@ -0,0 +1,44 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+
+class AssetTypeFilterBackend(BaseFilterBackend):
+    """
+    Filters notification and violation lists by ``?asset=<id>`` and
+    ``?type=<type>``, which together match the (asset, type) indexes.
+    The view names the model's type field in ``type_field``.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        asset_id = request.query_params.get('asset')
+        type_value = request.query_params.get('type')
+
+        if asset_id is not None:
+            try:
+                asset_id = int(asset_id)
+            except ValueError:
+                raise ValidationError({'asset': 'A valid integer is required.'})
+            queryset = queryset.filter(asset_id=asset_id)
+        if type_value is not None:
+            queryset = queryset.filter(**{view.type_field: type_value})
+
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        type_choices = view.queryset.model._meta.get_field(view.type_field).choices
+        return [
+            {
+                'name': 'asset',
+                'required': False,
+                'in': 'query',
+                'description': 'Only rows for this asset id',
+                'schema': {'type': 'integer'},
+            },
+            {
+                'name': 'type',
+                'required': False,
+                'in': 'query',
+                'description': 'Only rows of this type',
+                'schema': {'type': 'string', 'enum': [value for value, _ in type_choices]},
+            },
+        ]
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from assets.services import perform_checks
+
+
+class Command(BaseCommand):
+    help = "Create due notifications and violations, like POST /api/run-checks/"
+
+    def handle(self, *args, **options):
+        result = perform_checks(timezone.now())
+        self.stdout.write(self.style.SUCCESS(result['message']))
@@ -1,5 +1,6 @@
 from django.core.validators import MinLengthValidator
 from django.db import models
+from django.db.models import F, Q
 from django.utils import timezone
 
 
@@ -32,18 +33,40 @@ class Asset(models.Model):
         indexes = [
             models.Index(fields=['service_time']),
             models.Index(fields=['expiration_time']),
-            models.Index(fields=['is_serviced']),
+            # Partial index for the unserviced service-time scans: both the
+            # service reminder and the service overdue checks are range
+            # searches on it, so no (is_serviced, service_time) composite
+            # is needed. The expiration checks use the index above.
+            models.Index(
+                fields=['service_time'],
+                condition=Q(is_serviced=False),
+                name='asset_unserviced_svc_idx'
+            ),
+            # Serves the default ordering (admin changelist and API cursor
+            # pages) without a sort; the rows are still read from the table
+            models.Index(fields=['-created_at'], name='asset_created_desc_idx'),
+        ]
+        # full_clean() reports this message; the database enforces the
+        # ordering for writes that skip validation
+        constraints = [
+            models.CheckConstraint(
+                check=Q(service_time__lt=F('expiration_time')),
+                name='asset_svc_before_exp',
+                violation_error_message="Service time must be before expiration time"
+            )
         ]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored name so a rename can be copied to the
+        # denormalized asset_name on notifications and violations
+        instance._loaded_name = instance.__dict__.get('name')
+        return instance
+
     def __str__(self):
         return f"{self.name} (Service: {self.service_time}, Expires: {self.expiration_time})"
 
-    def clean(self):
-        from django.core.exceptions import ValidationError
-        if self.service_time and self.expiration_time:
-            if self.service_time >= self.expiration_time:
-                raise ValidationError("Service time must be before expiration time")
-
     @property
     def is_expired(self):
         return timezone.now() > self.expiration_time
@@ -53,7 +76,30 @@ class Asset(models.Model):
         return timezone.now() > self.service_time and not self.is_serviced
 
 
-class Notification(models.Model):
+class AssetNameMixin:
+    """
+    Keeps the denormalized asset_name in step with the row's asset when
+    the row is created or moved to another asset. Renaming an asset is
+    handled by the post_save receiver in signals.py.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_asset_id = instance.__dict__.get('asset_id')
+        return instance
+
+    def save(self, *args, **kwargs):
+        if not self.asset_name or self.asset_id != getattr(self, '_loaded_asset_id', None):
+            self.asset_name = self.asset.name
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and 'asset_name' not in update_fields:
+                kwargs['update_fields'] = [*update_fields, 'asset_name']
+        super().save(*args, **kwargs)
+        self._loaded_asset_id = self.asset_id
+
+
+class Notification(AssetNameMixin, models.Model):
     NOTIFICATION_TYPES = [
         ('service', 'Service Reminder'),
         ('expiration', 'Expiration Reminder'),
@@ -64,6 +110,9 @@ class Notification(models.Model):
         on_delete=models.CASCADE, 
         related_name='notifications'
     )
+    # Copy of asset.name so lists can be served without joining assets
+    # Filled in by save(); the empty default lets existing rows migrate
+    asset_name = models.CharField(max_length=200, default='', editable=False)
     notification_type = models.CharField(
         max_length=20, 
         choices=NOTIFICATION_TYPES
@@ -75,7 +124,8 @@ class Notification(models.Model):
         ordering = ['-sent_at']
         indexes = [
             models.Index(fields=['asset', 'notification_type']),
-            models.Index(fields=['sent_at']),
+            # Serves per-asset lists in default ordering without a sort
+            models.Index(fields=['asset', '-sent_at'], name='notif_asset_sent_desc_idx'),
         ]
         # Prevent duplicate notifications for same asset and type within a short time
         constraints = [
@@ -86,10 +136,10 @@ class Notification(models.Model):
         ]
 
     def __str__(self):
-        return f"{self.get_notification_type_display()} for {self.asset.name}"
+        return f"{self.get_notification_type_display()} for {self.asset_name}"
 
 
-class Violation(models.Model):
+class Violation(AssetNameMixin, models.Model):
     VIOLATION_TYPES = [
         ('expired', 'Asset Expired'),
         ('not_serviced', 'Service Overdue'),
@@ -100,6 +150,9 @@ class Violation(models.Model):
         on_delete=models.CASCADE, 
         related_name='violations'
     )
+    # Copy of asset.name so lists can be served without joining assets
+    # Filled in by save(); the empty default lets existing rows migrate
+    asset_name = models.CharField(max_length=200, default='', editable=False)
     violation_type = models.CharField(
         max_length=20, 
         choices=VIOLATION_TYPES
@@ -111,7 +164,8 @@ class Violation(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['asset', 'violation_type']),
-            models.Index(fields=['created_at']),
+            # Serves per-asset lists in default ordering without a sort
+            models.Index(fields=['asset', '-created_at'], name='viol_asset_created_desc_idx'),
         ]
         # Prevent duplicate violations for same asset and type
         constraints = [
@@ -122,4 +176,5 @@ class Violation(models.Model):
         ]
 
     def __str__(self):
-        return f"{self.get_violation_type_display()} for {self.asset.name}"
+        return f"{self.get_violation_type_display()} for {self.asset_name}"
+
@@ -0,0 +1,9 @@
+from rest_framework.pagination import CursorPagination
+
+
+class AssetCursorPagination(CursorPagination):
+    """
+    Seeks on the created_at index instead of counting the whole table
+    for every page, as PageNumberPagination does.
+    """
+    ordering = '-created_at'
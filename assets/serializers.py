@@ -1,25 +1,85 @@
+from django.db import models
 from django.utils import timezone
+from drf_yasg.utils import swagger_serializer_method
 from rest_framework import serializers
 
 from .models import Asset, Notification, Violation
 
 
+def _related_count(asset, related_name):
+    """
+    The asset's number of notifications or violations: the
+    ``<related_name>_count`` annotation AssetViewSet adds when present,
+    otherwise a COUNT query.
+    """
+    count = getattr(asset, f'{related_name}_count', None)
+    if count is None:
+        count = getattr(asset, related_name).count()
+    return count
+
+
+class AssetListSerializer(serializers.ListSerializer):
+    """
+    Builds list rows directly instead of running each AssetSerializer
+    field per asset. Keep the keys in sync with AssetSerializer.Meta.fields.
+    """
+    datetime_field = serializers.DateTimeField()
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        now = self.context.get('now') or timezone.now()
+        datetime_repr = self.datetime_field.to_representation
+
+        rows = []
+        for asset in iterable:
+            if hasattr(asset, 'is_expired_db'):
+                is_expired = asset.is_expired_db
+                is_service_overdue = asset.is_service_overdue_db
+            else:
+                is_expired = now > asset.expiration_time
+                is_service_overdue = now > asset.service_time and not asset.is_serviced
+            rows.append({
+                'id': asset.id,
+                'name': asset.name,
+                'description': asset.description,
+                'service_time': datetime_repr(asset.service_time),
+                'expiration_time': datetime_repr(asset.expiration_time),
+                'is_serviced': asset.is_serviced,
+                'is_expired': is_expired,
+                'is_service_overdue': is_service_overdue,
+                'notifications_count': _related_count(asset, 'notifications'),
+                'violations_count': _related_count(asset, 'violations'),
+                'created_at': datetime_repr(asset.created_at),
+                'updated_at': datetime_repr(asset.updated_at),
+            })
+        return rows
+
+
 class AssetSerializer(serializers.ModelSerializer):
-    is_expired = serializers.ReadOnlyField()
-    is_service_overdue = serializers.ReadOnlyField()
+    is_expired = serializers.SerializerMethodField()
+    is_service_overdue = serializers.SerializerMethodField()
+    # Annotated by AssetViewSet.get_queryset to avoid a COUNT query per row;
+    # counted directly for instances without the annotation
+    notifications_count = serializers.SerializerMethodField()
+    violations_count = serializers.SerializerMethodField()
     
     class Meta:
         model = Asset
         fields = [
             'id', 'name', 'description', 'service_time', 'expiration_time',
             'is_serviced', 'is_expired', 'is_service_overdue', 
+            'notifications_count', 'violations_count',
             'created_at', 'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at']
+        list_serializer_class = AssetListSerializer
 
     def validate(self, data):
-        if data.get('service_time') and data.get('expiration_time'):
-            if data['service_time'] >= data['expiration_time']:
+        # Partial updates are checked against the stored value of the other time
+        service_time = data.get('service_time', getattr(self.instance, 'service_time', None))
+        expiration_time = data.get('expiration_time', getattr(self.instance, 'expiration_time', None))
+        if service_time and expiration_time:
+            if service_time >= expiration_time:
                 raise serializers.ValidationError(
                     "Service time must be before expiration time"
                 )
@@ -38,10 +98,31 @@ class AssetSerializer(serializers.ModelSerializer):
         
         return data
 
+    # List querysets from AssetViewSet carry these flags as DB annotations;
+    # single instances are compared against the request's "now".
+    def _now(self):
+        return self.context.get('now') or timezone.now()
+
+    @swagger_serializer_method(serializer_or_field=serializers.IntegerField())
+    def get_notifications_count(self, obj):
+        return _related_count(obj, 'notifications')
+
+    @swagger_serializer_method(serializer_or_field=serializers.IntegerField())
+    def get_violations_count(self, obj):
+        return _related_count(obj, 'violations')
+
+    def get_is_expired(self, obj):
+        if hasattr(obj, 'is_expired_db'):
+            return obj.is_expired_db
+        return self._now() > obj.expiration_time
+
+    def get_is_service_overdue(self, obj):
+        if hasattr(obj, 'is_service_overdue_db'):
+            return obj.is_service_overdue_db
+        return self._now() > obj.service_time and not obj.is_serviced
+
 
 class NotificationSerializer(serializers.ModelSerializer):
-    asset_name = serializers.CharField(source='asset.name', read_only=True)
-    
     class Meta:
         model = Notification
         fields = [
@@ -52,8 +133,6 @@ class NotificationSerializer(serializers.ModelSerializer):
 
 
 class ViolationSerializer(serializers.ModelSerializer):
-    asset_name = serializers.CharField(source='asset.name', read_only=True)
-    
     class Meta:
         model = Violation
         fields = [
@@ -63,8 +142,28 @@ class ViolationSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at']
 
 
+class CheckNotificationDetailSerializer(serializers.Serializer):
+    asset = serializers.CharField()
+    type = serializers.ChoiceField(choices=Notification.NOTIFICATION_TYPES)
+    time = serializers.DateTimeField()
+
+
+class CheckViolationDetailSerializer(serializers.Serializer):
+    asset = serializers.CharField()
+    type = serializers.ChoiceField(choices=Violation.VIOLATION_TYPES)
+    # Set for 'not_serviced' violations
+    due_time = serializers.DateTimeField(required=False)
+    # Set for 'expired' violations
+    expired_time = serializers.DateTimeField(required=False)
+
+
+class CheckDetailsSerializer(serializers.Serializer):
+    notifications = CheckNotificationDetailSerializer(many=True)
+    violations = CheckViolationDetailSerializer(many=True)
+
+
 class CheckResultSerializer(serializers.Serializer):
     notifications_created = serializers.IntegerField()
     violations_created = serializers.IntegerField()
     message = serializers.CharField()
-    details = serializers.DictField()
\ No newline at end of file
+    details = CheckDetailsSerializer()
\ No newline at end of file
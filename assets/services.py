@@ -0,0 +1,257 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import BooleanField, Exists, ExpressionWrapper, OuterRef, Q
+
+from .models import Asset, Notification, Violation
+
+
+# Assets fetched per round-trip in the perform_checks scan, and pending
+# rows per flush
+CHECK_CHUNK_SIZE = 1000
+# Rows per multi-VALUES INSERT; backends with a lower parameter limit
+# (SQLite) get smaller batches from Django automatically
+BULK_BATCH_SIZE = 1000
+# Created rows listed per kind in the result; the counts stay exact
+DETAILS_CAP = 100
+
+# Bound format methods for the per-row messages, looked up once
+SERVICE_REMINDER_MSG = 'Service reminder: Asset "{name}" needs service at {time}'.format
+EXPIRATION_REMINDER_MSG = 'Expiration reminder: Asset "{name}" expires at {time}'.format
+SERVICE_OVERDUE_MSG = 'Service overdue: Asset "{name}" was due for service at {time}'.format
+EXPIRED_MSG = 'Asset expired: Asset "{name}" expired at {time}'.format
+
+
+def _save_notifications(pending):
+    """
+    Upsert (notification, detail) pairs and return the details of the
+    ones that did not exist before.
+    """
+    # Look up which pairs already exist so the created counts stay exact;
+    # one unordered query on the (asset, type) index, no instances built
+    existing = set(
+        Notification.objects.filter(
+            asset_id__in={n.asset_id for n, _ in pending}
+        ).order_by().values_list('asset_id', 'notification_type')
+    )
+    # Upsert every due reminder: new ones are inserted, existing ones
+    # get the current message and sent_at, all in one statement.
+    Notification.objects.bulk_create(
+        [n for n, _ in pending],
+        batch_size=BULK_BATCH_SIZE,
+        update_conflicts=True,
+        update_fields=['asset_name', 'message', 'sent_at'],
+        unique_fields=['asset', 'notification_type']
+    )
+    return [
+        detail for n, detail in pending
+        if (n.asset_id, n.notification_type) not in existing
+    ]
+
+
+def _save_violations(pending):
+    """
+    Insert (violation, detail) pairs that do not exist yet and return
+    their details.
+    """
+    # The scan already skips assets with the violation; this catches rows
+    # a concurrent run inserted since, so the created counts stay exact
+    existing = set(
+        Violation.objects.filter(
+            asset_id__in={v.asset_id for v, _ in pending}
+        ).order_by().values_list('asset_id', 'violation_type')
+    )
+    new_violations = [
+        (v, detail) for v, detail in pending
+        if (v.asset_id, v.violation_type) not in existing
+    ]
+    # Violations record when a breach was first detected, so existing
+    # rows are left untouched; ignore_conflicts covers concurrent runs.
+    Violation.objects.bulk_create(
+        [v for v, _ in new_violations],
+        batch_size=BULK_BATCH_SIZE,
+        ignore_conflicts=True
+    )
+    return [detail for _, detail in new_violations]
+
+
+def _flush(pending, save, totals):
+    """
+    Save pending (object, detail) pairs with save() and add what it
+    created to totals, keeping at most DETAILS_CAP details.
+    """
+    new_details = save(pending)
+    totals['created'] += len(new_details)
+    details = totals['details']
+    details += new_details[:DETAILS_CAP - len(details)]
+    pending.clear()
+
+
+@transaction.atomic
+def perform_checks(now):
+    """
+    Create the notifications and violations due at ``now``.
+
+    Returns the counts, a summary message and the details of the rows
+    created (at most DETAILS_CAP per kind), in the shape of
+    CheckResultSerializer. Detail times are datetimes; only the capped
+    details get formatted, by the serializer. Running it again at the
+    same time creates nothing new.
+    """
+    reminder_threshold = now + timedelta(minutes=15)
+    
+    # Conditions for each check. Reminders only match inside their 15
+    # minute window; the violation checks skip assets that already have
+    # that violation, so an asset that stays expired or overdue is not
+    # matched (or locked) again by every later run.
+    service_reminder = (
+        Q(service_time__gt=now) &
+        Q(service_time__lte=reminder_threshold) &
+        Q(is_serviced=False)
+    )
+    expiration_reminder = (
+        Q(expiration_time__gt=now) &
+        Q(expiration_time__lte=reminder_threshold)
+    )
+    service_overdue = (
+        Q(service_time__lte=now) &
+        Q(is_serviced=False) &
+        ~Exists(Violation.objects.filter(
+            asset=OuterRef('pk'), violation_type='not_serviced'
+        ))
+    )
+    expired = (
+        Q(expiration_time__lte=now) &
+        ~Exists(Violation.objects.filter(
+            asset=OuterRef('pk'), violation_type='expired'
+        ))
+    )
+
+    # One scan over the assets that any check can match, each row tagged
+    # by the database with the checks it is due for. Only the columns the
+    # checks need come back, streamed in chunks, in no particular order.
+    # On backends with row locks (e.g. PostgreSQL) matched rows are locked
+    # for the transaction and rows locked by a concurrent run are skipped
+    # until a later run. SQLite has no row locks and ignores this, so
+    # concurrent runs there rely on the unique constraints alone.
+    assets = Asset.objects.order_by().select_for_update(
+        skip_locked=True
+    ).filter(
+        service_reminder | expiration_reminder | service_overdue | expired
+    ).annotate(
+        # 15 minutes before service time, not yet serviced
+        service_reminder=ExpressionWrapper(
+            service_reminder, output_field=BooleanField()
+        ),
+        # 15 minutes before expiration
+        expiration_reminder=ExpressionWrapper(
+            expiration_reminder, output_field=BooleanField()
+        ),
+        # Service time passed, not serviced, no violation yet
+        service_overdue=ExpressionWrapper(
+            service_overdue, output_field=BooleanField()
+        ),
+        # Expiration time passed, no violation yet
+        expired=ExpressionWrapper(
+            expired, output_field=BooleanField()
+        ),
+    ).values_list(
+        'id', 'name', 'service_time', 'expiration_time',
+        'service_reminder', 'expiration_reminder', 'service_overdue', 'expired'
+    )
+    
+    notifications = {'created': 0, 'details': []}
+    violations = {'created': 0, 'details': []}
+    # (unsaved object, detail entry) pairs, saved in bulk per chunk
+    pending_notifications = []
+    pending_violations = []
+    # Bound once as locals for the per-row loop
+    add_notification = pending_notifications.append
+    add_violation = pending_violations.append
+    chunk_size = CHECK_CHUNK_SIZE
+    
+    for (asset_id, name, service_time, expiration_time, service_reminder,
+         expiration_reminder, service_overdue, expired
+         ) in assets.iterator(chunk_size=chunk_size):
+        if service_reminder:
+            add_notification((
+                Notification(
+                    asset_id=asset_id,
+                    asset_name=name,
+                    notification_type='service',
+                    message=SERVICE_REMINDER_MSG(name=name, time=service_time)
+                ),
+                {
+                    'asset': name,
+                    'type': 'service',
+                    'time': service_time
+                }
+            ))
+        
+        if expiration_reminder:
+            add_notification((
+                Notification(
+                    asset_id=asset_id,
+                    asset_name=name,
+                    notification_type='expiration',
+                    message=EXPIRATION_REMINDER_MSG(name=name, time=expiration_time)
+                ),
+                {
+                    'asset': name,
+                    'type': 'expiration',
+                    'time': expiration_time
+                }
+            ))
+        
+        if service_overdue:
+            add_violation((
+                Violation(
+                    asset_id=asset_id,
+                    asset_name=name,
+                    violation_type='not_serviced',
+                    description=SERVICE_OVERDUE_MSG(name=name, time=service_time)
+                ),
+                {
+                    'asset': name,
+                    'type': 'not_serviced',
+                    'due_time': service_time
+                }
+            ))
+        
+        if expired:
+            add_violation((
+                Violation(
+                    asset_id=asset_id,
+                    asset_name=name,
+                    violation_type='expired',
+                    description=EXPIRED_MSG(name=name, time=expiration_time)
+                ),
+                {
+                    'asset': name,
+                    'type': 'expired',
+                    'expired_time': expiration_time
+                }
+            ))
+        
+        if len(pending_notifications) >= chunk_size:
+            _flush(pending_notifications, _save_notifications, notifications)
+        if len(pending_violations) >= chunk_size:
+            _flush(pending_violations, _save_violations, violations)
+    
+    if pending_notifications:
+        _flush(pending_notifications, _save_notifications, notifications)
+    if pending_violations:
+        _flush(pending_violations, _save_violations, violations)
+    
+    notifications_created = notifications['created']
+    violations_created = violations['created']
+    
+    return {
+        'notifications_created': notifications_created,
+        'violations_created': violations_created,
+        'message': f'Check completed. Created {notifications_created} notifications and {violations_created} violations.',
+        'details': {
+            'notifications': notifications['details'],
+            'violations': violations['details']
+        }
+    }
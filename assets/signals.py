@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Asset, Notification, Violation
+
+
+@receiver(post_save, sender=Asset)
+def sync_asset_name(sender, instance, created, **kwargs):
+    """Copy a renamed asset's name to its notifications and violations."""
+    if not created and instance.name != getattr(instance, '_loaded_name', None):
+        Notification.objects.filter(asset=instance).update(asset_name=instance.name)
+        Violation.objects.filter(asset=instance).update(asset_name=instance.name)
+    instance._loaded_name = instance.name
@@ -1,21 +1,58 @@
-from datetime import timedelta
+import json
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from io import StringIO
 from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
-from django.test import TestCase
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APIRequestFactory, APITestCase
 
 from .models import Asset, Notification, Violation
+from .serializers import AssetSerializer
+from .services import perform_checks
+from .views import AssetViewSet
+
+ONE_HOUR = timedelta(hours=1)
+ONE_DAY = timedelta(days=1)
+TEN_MIN = timedelta(minutes=10)
+FIFTEEN_MIN = timedelta(minutes=15)
+SIXTEEN_MIN = timedelta(minutes=16)
+TWO_HOURS = timedelta(hours=2)
+
+create_asset_view = AssetViewSet.as_view({'post': 'create'})
+
+
+def post_asset(data):
+    """POST to the asset create view directly, skipping routing and middleware"""
+    request = APIRequestFactory().post(reverse('asset-list'), data, format='json')
+    return create_asset_view(request)
+
+
+class _AssetFixtureMixin:
+    """One shared asset per test class for tests of its related rows"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.now = timezone.now()
+        cls.asset = Asset.objects.create(
+            name="Test Asset",
+            service_time=cls.now + ONE_HOUR,
+            expiration_time=cls.now + ONE_DAY
+        )
 
 
 class AssetModelTestCase(TestCase):
-    def setUp(self):
-        self.now = timezone.now()
-        self.service_time = self.now + timedelta(hours=1)
-        self.expiration_time = self.now + timedelta(days=1)
+    @classmethod
+    def setUpTestData(cls):
+        cls.now = timezone.now()
+        cls.service_time = cls.now + ONE_HOUR
+        cls.expiration_time = cls.now + ONE_DAY
         
     def test_asset_creation(self):
         asset = Asset.objects.create(
@@ -33,21 +70,34 @@ class AssetModelTestCase(TestCase):
         # Test expired asset
         expired_asset = Asset.objects.create(
             name="Expired Asset",
-            service_time=self.now - timedelta(hours=2),
-            expiration_time=self.now - timedelta(hours=1)
+            service_time=self.now - TWO_HOURS,
+            expiration_time=self.now - ONE_HOUR
         )
         self.assertTrue(expired_asset.is_expired)
         self.assertTrue(expired_asset.is_service_overdue)
 
     def test_asset_clean_validation(self):
-        """Test model clean method validation"""
+        """Test model validation reports the time order error once"""
         asset = Asset(
             name="Invalid Asset",
             service_time=self.expiration_time,
             expiration_time=self.service_time
         )
-        with self.assertRaises(ValidationError):
-            asset.clean()
+        with self.assertRaises(ValidationError) as cm:
+            asset.full_clean()
+        self.assertEqual(
+            cm.exception.messages,
+            ["Service time must be before expiration time"]
+        )
+
+    def test_asset_time_order_constraint(self):
+        """Test database check constraint on service/expiration order"""
+        with self.assertRaises(IntegrityError):
+            Asset.objects.create(
+                name="Invalid Asset",
+                service_time=self.expiration_time,
+                expiration_time=self.service_time
+            )
 
     def test_asset_str_representation(self):
         """Test string representation"""
@@ -65,7 +115,7 @@ class AssetModelTestCase(TestCase):
         exact_time_asset = Asset.objects.create(
             name="Exact Time Asset",
             service_time=self.now,
-            expiration_time=self.now + timedelta(hours=1)
+            expiration_time=self.now + ONE_HOUR
         )
         # Should be considered overdue
         self.assertTrue(exact_time_asset.is_service_overdue)
@@ -79,15 +129,7 @@ class AssetModelTestCase(TestCase):
         self.assertFalse(close_times_asset.is_expired)
         self.assertFalse(close_times_asset.is_service_overdue)
 
-class NotificationModelTestCase(TestCase):
-    def setUp(self):
-        self.now = timezone.now()
-        self.asset = Asset.objects.create(
-            name="Test Asset",
-            service_time=self.now + timedelta(hours=1),
-            expiration_time=self.now + timedelta(days=1)
-        )
-
+class NotificationModelTestCase(_AssetFixtureMixin, TestCase):
     def test_notification_creation(self):
         """Test notification creation"""
         notification = Notification.objects.create(
@@ -108,6 +150,24 @@ class NotificationModelTestCase(TestCase):
         expected_str = f"Service Reminder for {self.asset.name}"
         self.assertEqual(str(notification), expected_str)
 
+    def test_notification_moved_to_other_asset(self):
+        """Test that moving a notification to another asset updates asset_name"""
+        other = Asset.objects.create(
+            name="Other Asset",
+            service_time=self.now + ONE_HOUR,
+            expiration_time=self.now + ONE_DAY
+        )
+        notification = Notification.objects.create(
+            asset=self.asset,
+            notification_type='service',
+            message='Test notification'
+        )
+        notification = Notification.objects.get(pk=notification.pk)
+        notification.asset = other
+        notification.save()
+        notification.refresh_from_db()
+        self.assertEqual(notification.asset_name, 'Other Asset')
+
     def test_duplicate_notification_constraint(self):
         """Test unique constraint for notifications"""
         Notification.objects.create(
@@ -122,15 +182,7 @@ class NotificationModelTestCase(TestCase):
                 message='Duplicate message'
             )
 
-class ViolationModelTestCase(TestCase):
-    def setUp(self):
-        self.now = timezone.now()
-        self.asset = Asset.objects.create(
-            name="Test Asset",
-            service_time=self.now - timedelta(hours=1),
-            expiration_time=self.now + timedelta(days=1)
-        )
-
+class ViolationModelTestCase(_AssetFixtureMixin, TestCase):
     def test_violation_creation(self):
         """Test violation creation"""
         violation = Violation.objects.create(
@@ -151,6 +203,24 @@ class ViolationModelTestCase(TestCase):
         expected_str = f"Service Overdue for {self.asset.name}"
         self.assertEqual(str(violation), expected_str)
 
+    def test_violation_moved_to_other_asset(self):
+        """Test that moving a violation to another asset updates asset_name"""
+        other = Asset.objects.create(
+            name="Other Asset",
+            service_time=self.now + ONE_HOUR,
+            expiration_time=self.now + ONE_DAY
+        )
+        violation = Violation.objects.create(
+            asset=self.asset,
+            violation_type='not_serviced',
+            description='Test violation'
+        )
+        violation = Violation.objects.get(pk=violation.pk)
+        violation.asset = other
+        violation.save()
+        violation.refresh_from_db()
+        self.assertEqual(violation.asset_name, 'Other Asset')
+
     def test_duplicate_violation_constraint(self):
         """Test unique constraint for violations"""
         Violation.objects.create(
@@ -166,82 +236,40 @@ class ViolationModelTestCase(TestCase):
             )
 
 class AssetAPITestCase(APITestCase):
-    def setUp(self):
-        self.now = timezone.now()
-        self.service_time = self.now + timedelta(hours=1)
-        self.expiration_time = self.now + timedelta(days=1)
-        
-    def test_create_asset(self):
-        data = {
+    @classmethod
+    def setUpTestData(cls):
+        cls.now = timezone.now()
+        cls.service_time = cls.now + ONE_HOUR
+        cls.expiration_time = cls.now + ONE_DAY
+        cls.list_url = reverse('asset-list')
+        # Payloads reused across tests, encoded once for the class
+        cls.valid_payload = json.dumps({
             'name': 'Test Asset',
             'description': 'Test Description',
-            'service_time': self.service_time.isoformat(),
-            'expiration_time': self.expiration_time.isoformat()
-        }
-        response = self.client.post('/api/assets/', data, format='json')
+            'service_time': cls.service_time.isoformat(),
+            'expiration_time': cls.expiration_time.isoformat()
+        }).encode()
+        cls.rename_payload = json.dumps({'name': 'Updated Asset'}).encode()
+        
+    def test_create_asset(self):
+        response = self.client.post(
+            self.list_url, self.valid_payload, content_type='application/json'
+        )
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Asset.objects.count(), 1)
-
-    def test_invalid_asset_creation(self):
-        # Service time after expiration time
-        data = {
-            'name': 'Invalid Asset',
-            'service_time': self.expiration_time.isoformat(),
-            'expiration_time': self.service_time.isoformat()
-        }
-        response = self.client.post('/api/assets/', data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-
-    def test_create_asset_with_past_times(self):
-        """Test creating asset with past times (should fail)"""
-        past_time = self.now - timedelta(hours=1)
-        data = {
-            'name': 'Past Asset',
-            'service_time': past_time.isoformat(),
-            'expiration_time': self.expiration_time.isoformat()
-        }
-        response = self.client.post('/api/assets/', data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-
-    def test_create_asset_empty_name(self):
-        """Test creating asset with empty name"""
-        data = {
-            'name': '',
-            'service_time': self.service_time.isoformat(),
-            'expiration_time': self.expiration_time.isoformat()
-        }
-        response = self.client.post('/api/assets/', data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-
-    def test_create_asset_short_name(self):
-        """Test creating asset with too short name"""
-        data = {
-            'name': 'A',
-            'service_time': self.service_time.isoformat(),
-            'expiration_time': self.expiration_time.isoformat()
-        }
-        response = self.client.post('/api/assets/', data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-
-    def test_create_asset_invalid_datetime_format(self):
-        """Test creating asset with invalid datetime format"""
-        data = {
-            'name': 'Test Asset',
-            'service_time': 'invalid-datetime',
-            'expiration_time': self.expiration_time.isoformat()
-        }
-        response = self.client.post('/api/assets/', data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        # Same shape as the read responses
+        self.assertEqual(response.data['notifications_count'], 0)
+        self.assertEqual(response.data['violations_count'], 0)
 
     def test_get_all_assets_empty(self):
         """Test getting all assets when none exist"""
-        response = self.client.get('/api/assets/')
+        response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 0)
+        self.assertEqual(response.data['results'], [])
 
     def test_get_single_asset_not_found(self):
         """Test getting non-existent asset"""
-        response = self.client.get('/api/assets/999/')
+        response = self.client.get(reverse('asset-detail', args=[999]))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_update_asset_partial(self):
@@ -251,16 +279,30 @@ class AssetAPITestCase(APITestCase):
             service_time=self.service_time,
             expiration_time=self.expiration_time
         )
-        data = {'name': 'Updated Asset'}
-        response = self.client.patch(f'/api/assets/{asset.id}/', data, format='json')
+        response = self.client.patch(
+            reverse('asset-detail', args=[asset.id]), self.rename_payload,
+            content_type='application/json'
+        )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        asset.refresh_from_db()
-        self.assertEqual(asset.name, 'Updated Asset')
+        self.assertEqual(response.data['name'], 'Updated Asset')
+
+    def test_update_asset_partial_invalid_order(self):
+        """Test partial update moving service time past stored expiration"""
+        asset = Asset.objects.create(
+            name="Original Asset",
+            service_time=self.service_time,
+            expiration_time=self.expiration_time
+        )
+        data = {'service_time': (self.expiration_time + ONE_HOUR).isoformat()}
+        response = self.client.patch(reverse('asset-detail', args=[asset.id]), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_update_nonexistent_asset(self):
         """Test updating non-existent asset"""
-        data = {'name': 'Updated Asset'}
-        response = self.client.put('/api/assets/999/', data, format='json')
+        response = self.client.put(
+            reverse('asset-detail', args=[999]), self.rename_payload,
+            content_type='application/json'
+        )
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_delete_asset(self):
@@ -270,13 +312,13 @@ class AssetAPITestCase(APITestCase):
             service_time=self.service_time,
             expiration_time=self.expiration_time
         )
-        response = self.client.delete(f'/api/assets/{asset.id}/')
+        response = self.client.delete(reverse('asset-detail', args=[asset.id]))
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Asset.objects.filter(id=asset.id).exists())
 
     def test_delete_nonexistent_asset(self):
         """Test deleting non-existent asset"""
-        response = self.client.delete('/api/assets/999/')
+        response = self.client.delete(reverse('asset-detail', args=[999]))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_mark_asset_serviced(self):
@@ -285,28 +327,137 @@ class AssetAPITestCase(APITestCase):
             service_time=self.service_time,
             expiration_time=self.expiration_time
         )
-        response = self.client.post(f'/api/assets/{asset.id}/mark_serviced/')
+        # One SELECT for the asset, one UPDATE of the changed columns
+        with self.assertNumQueries(2):
+            response = self.client.post(reverse('asset-mark-serviced', args=[asset.id]))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        asset.refresh_from_db()
-        self.assertTrue(asset.is_serviced)
+        self.assertTrue(response.data['asset']['is_serviced'])
+        self.assertFalse(response.data['asset']['is_service_overdue'])
 
     def test_mark_nonexistent_asset_serviced(self):
         """Test marking non-existent asset as serviced"""
-        response = self.client.post('/api/assets/999/mark_serviced/')
+        response = self.client.post(reverse('asset-mark-serviced', args=[999]))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
-class NotificationAPITestCase(APITestCase):
-    def setUp(self):
-        self.now = timezone.now()
-        self.asset = Asset.objects.create(
+    def test_asset_related_counts(self):
+        """Test notification and violation counts on asset responses"""
+        asset = Asset.objects.create(
+            name="Counted Asset",
+            service_time=self.service_time,
+            expiration_time=self.expiration_time
+        )
+        Notification.objects.bulk_create([
+            Notification(asset=asset, asset_name=asset.name, notification_type='service', message='Service'),
+            Notification(asset=asset, asset_name=asset.name, notification_type='expiration', message='Expiration'),
+        ])
+        Violation.objects.create(asset=asset, violation_type='expired', description='Expired')
+
+        response = self.client.get(reverse('asset-detail', args=[asset.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['notifications_count'], 2)
+        self.assertEqual(response.data['violations_count'], 1)
+
+    def test_list_assets_status_flags(self):
+        """Test expiry and overdue flags on the asset list"""
+        Asset.objects.bulk_create([
+            Asset(
+                name="Expired Asset",
+                service_time=self.now - TWO_HOURS,
+                expiration_time=self.now - ONE_HOUR
+            ),
+            Asset(
+                name="Serviced Asset",
+                service_time=self.now - ONE_HOUR,
+                expiration_time=self.expiration_time,
+                is_serviced=True
+            ),
+        ])
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        flags = {
+            item['name']: (item['is_expired'], item['is_service_overdue'])
+            for item in response.data['results']
+        }
+        self.assertEqual(flags['Expired Asset'], (True, True))
+        self.assertEqual(flags['Serviced Asset'], (False, False))
+
+    def test_list_rows_match_detail(self):
+        """Test that list rows have the same shape as the detail response"""
+        asset = Asset.objects.create(
             name="Test Asset",
-            service_time=self.now + timedelta(hours=1),
-            expiration_time=self.now + timedelta(days=1)
+            description="Test Description",
+            service_time=self.service_time,
+            expiration_time=self.expiration_time
         )
+        list_response = self.client.get(self.list_url)
+        detail_response = self.client.get(reverse('asset-detail', args=[asset.id]))
+        self.assertEqual(list_response.data['results'][0], detail_response.data)
 
+class AssetSerializerTestCase(TestCase):
+    def test_serialize_queryset_without_annotations(self):
+        """Test many=True on a plain queryset counts the related rows"""
+        now = timezone.now()
+        asset = Asset.objects.create(
+            name="Plain Asset",
+            service_time=now + ONE_HOUR,
+            expiration_time=now + ONE_DAY
+        )
+        Notification.objects.create(asset=asset, notification_type='service', message='Service')
+
+        data = AssetSerializer(Asset.objects.all(), many=True).data
+        self.assertEqual(data[0]['notifications_count'], 1)
+        self.assertEqual(data[0]['violations_count'], 0)
+
+class AssetValidationAPITestCase(SimpleTestCase):
+    """Requests rejected before any database access"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.now = timezone.now()
+        cls.service_time = cls.now + ONE_HOUR
+        cls.expiration_time = cls.now + ONE_DAY
+
+    def test_create_asset_invalid_payloads(self):
+        """Test that invalid create payloads are rejected"""
+        service_time = self.service_time.isoformat()
+        expiration_time = self.expiration_time.isoformat()
+        cases = {
+            'service after expiration': {
+                'name': 'Invalid Asset',
+                'service_time': expiration_time,
+                'expiration_time': service_time
+            },
+            'past service time': {
+                'name': 'Past Asset',
+                'service_time': (self.now - ONE_HOUR).isoformat(),
+                'expiration_time': expiration_time
+            },
+            'empty name': {
+                'name': '',
+                'service_time': service_time,
+                'expiration_time': expiration_time
+            },
+            'short name': {
+                'name': 'A',
+                'service_time': service_time,
+                'expiration_time': expiration_time
+            },
+            'invalid datetime format': {
+                'name': 'Test Asset',
+                'service_time': 'invalid-datetime',
+                'expiration_time': expiration_time
+            },
+        }
+        for case, data in cases.items():
+            with self.subTest(case):
+                response = post_asset(data)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+class NotificationAPITestCase(_AssetFixtureMixin, APITestCase):
     def test_get_notifications_empty(self):
         """Test getting notifications when none exist"""
-        response = self.client.get('/api/notifications/')
+        response = self.client.get(reverse('notification-list'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 0)
 
@@ -317,15 +468,38 @@ class NotificationAPITestCase(APITestCase):
             notification_type='service',
             message='Test notification'
         )
-        response = self.client.get('/api/notifications/')
+        response = self.client.get(reverse('notification-list'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 1)
 
+    def test_get_notifications_constant_queries(self):
+        """Test that listing notifications does not query assets per row"""
+        for i in range(3):
+            asset = Asset.objects.create(
+                name=f"Asset {i}",
+                service_time=self.now + ONE_HOUR,
+                expiration_time=self.now + ONE_DAY
+            )
+            Notification.objects.create(
+                asset=asset,
+                notification_type='service',
+                message=f'Notification {i}'
+            )
+
+        # One COUNT for pagination, one SELECT for the page
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('notification-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {item['asset_name'] for item in response.data['results']},
+            {'Asset 0', 'Asset 1', 'Asset 2'}
+        )
+
     def test_filter_notifications_by_asset(self):
         """Test filtering notifications by asset"""
         asset2 = Asset.objects.create(
             name="Asset 2",
-            service_time=self.now + timedelta(hours=2),
+            service_time=self.now + TWO_HOURS,
             expiration_time=self.now + timedelta(days=2)
         )
         Notification.objects.create(
@@ -339,10 +513,16 @@ class NotificationAPITestCase(APITestCase):
             message='Notification 2'
         )
         
-        response = self.client.get(f'/api/notifications/?asset={self.asset.id}')
+        response = self.client.get(reverse('notification-list'), {'asset': self.asset.id})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 1)
 
+    def test_filter_notifications_by_invalid_asset(self):
+        """Test that a non-numeric asset filter is rejected"""
+        response = self.client.get(reverse('notification-list'), {'asset': 'abc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('asset', response.data)
+
     def test_filter_notifications_by_type(self):
         """Test filtering notifications by type"""
         Notification.objects.create(
@@ -351,31 +531,67 @@ class NotificationAPITestCase(APITestCase):
             message='Service notification'
         )
         
-        response = self.client.get('/api/notifications/?type=service')
+        response = self.client.get(reverse('notification-list'), {'type': 'service'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 1)
 
-class ViolationAPITestCase(APITestCase):
-    def setUp(self):
-        self.now = timezone.now()
-        self.asset = Asset.objects.create(
-            name="Test Asset",
-            service_time=self.now - timedelta(hours=1),
-            expiration_time=self.now + timedelta(days=1)
+    def test_asset_rename_updates_notification(self):
+        """Test that renaming an asset updates its notifications"""
+        Notification.objects.create(
+            asset=self.asset,
+            notification_type='service',
+            message='Service notification'
         )
+        response = self.client.patch(
+            reverse('asset-detail', args=[self.asset.id]), {'name': 'Renamed Asset'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse('notification-list'))
+        self.assertEqual(response.data['results'][0]['asset_name'], 'Renamed Asset')
 
+class ViolationAPITestCase(_AssetFixtureMixin, APITestCase):
     def test_get_violations_empty(self):
         """Test getting violations when none exist"""
-        response = self.client.get('/api/violations/')
+        response = self.client.get(reverse('violation-list'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 0)
 
+    def test_get_violations_constant_queries(self):
+        """Test that listing violations does not query assets per row"""
+        assets = Asset.objects.bulk_create([
+            Asset(
+                name=f"Asset {i}",
+                service_time=self.now - TWO_HOURS,
+                expiration_time=self.now - ONE_HOUR
+            )
+            for i in range(3)
+        ])
+        Violation.objects.bulk_create([
+            Violation(
+                asset=asset,
+                asset_name=asset.name,
+                violation_type='expired',
+                description=f'Violation {i}'
+            )
+            for i, asset in enumerate(assets)
+        ])
+
+        # One COUNT for pagination, one SELECT for the page
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('violation-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {item['asset_name'] for item in response.data['results']},
+            {'Asset 0', 'Asset 1', 'Asset 2'}
+        )
+
     def test_filter_violations_by_asset(self):
         """Test filtering violations by asset"""
         asset2 = Asset.objects.create(
             name="Asset 2",
-            service_time=self.now - timedelta(hours=2),
-            expiration_time=self.now - timedelta(hours=1)
+            service_time=self.now - TWO_HOURS,
+            expiration_time=self.now - ONE_HOUR
         )
         Violation.objects.create(
             asset=self.asset,
@@ -388,7 +604,7 @@ class ViolationAPITestCase(APITestCase):
             description='Violation 2'
         )
         
-        response = self.client.get(f'/api/violations/?asset={self.asset.id}')
+        response = self.client.get(reverse('violation-list'), {'asset': self.asset.id})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 1)
 
@@ -400,165 +616,274 @@ class ViolationAPITestCase(APITestCase):
             description='Not serviced violation'
         )
         
-        response = self.client.get('/api/violations/?type=not_serviced')
+        response = self.client.get(reverse('violation-list'), {'type': 'not_serviced'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 1)
 
 class ChecksAPITestCase(APITestCase):
-    def setUp(self):
-        self.now = timezone.now()
+    # The clock is frozen for the whole class, fixture included, so the
+    # 15 minute boundaries do not depend on how long the tests take
+    FROZEN_NOW = datetime(2025, 1, 1, 12, 0, tzinfo=dt_timezone.utc)
+
+    @classmethod
+    def setUpClass(cls):
+        patcher = patch.object(timezone, 'now', return_value=cls.FROZEN_NOW)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.now = timezone.now()
+        # One asset per scenario, inserted in a single statement. Each test
+        # asserts on the scenario it covers; a full run over all of them
+        # creates 2 notifications and 3 violations.
+        Asset.objects.bulk_create([
+            Asset(
+                name="Service Due Soon",
+                service_time=cls.now + TEN_MIN,
+                expiration_time=cls.now + ONE_DAY
+            ),
+            Asset(
+                name="Exactly 15 Min Asset",
+                service_time=cls.now + FIFTEEN_MIN,
+                expiration_time=cls.now + ONE_DAY
+            ),
+            Asset(
+                name="Over 15 Min Asset",
+                service_time=cls.now + SIXTEEN_MIN,
+                expiration_time=cls.now + ONE_DAY
+            ),
+            Asset(
+                name="Overdue Asset",
+                service_time=cls.now - ONE_HOUR,
+                expiration_time=cls.now + ONE_DAY
+            ),
+            Asset(
+                name="Serviced Overdue Asset",
+                service_time=cls.now - ONE_HOUR,
+                expiration_time=cls.now + ONE_DAY,
+                is_serviced=True
+            ),
+            Asset(
+                name="Expired Asset",
+                service_time=cls.now - TWO_HOURS,
+                expiration_time=cls.now - ONE_HOUR
+            ),
+            Asset(
+                name="Future Asset",
+                service_time=cls.now + ONE_DAY,
+                expiration_time=cls.now + timedelta(days=2)
+            ),
+        ])
+
+    def run_checks(self):
+        return perform_checks(self.now)
+
+    def created_types(self, result, kind, asset_name):
+        """Types of the notifications or violations a run created for an asset"""
+        return sorted(
+            item['type'] for item in result['details'][kind]
+            if item['asset'] == asset_name
+        )
+
+    def test_run_checks_endpoint(self):
+        """Test the run checks endpoint end to end"""
+        response = self.client.post(reverse('run-checks'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['notifications_created'], 2)
+        self.assertEqual(response.data['violations_created'], 3)
+        self.assertEqual(
+            response.data['message'],
+            'Check completed. Created 2 notifications and 3 violations.'
+        )
+        notification = next(
+            item for item in response.data['details']['notifications']
+            if item['asset'] == 'Service Due Soon'
+        )
+        self.assertEqual(notification['time'], '2025-01-01T12:10:00Z')
+        violation = next(
+            item for item in response.data['details']['violations']
+            if item['asset'] == 'Overdue Asset'
+        )
+        self.assertEqual(violation, {
+            'asset': 'Overdue Asset',
+            'type': 'not_serviced',
+            'due_time': '2025-01-01T11:00:00Z'
+        })
         
+    def test_run_checks_command(self):
+        """Test the run_checks management command"""
+        out = StringIO()
+        call_command('run_checks', stdout=out)
+        self.assertIn('Created 2 notifications and 3 violations', out.getvalue())
+        self.assertEqual(Violation.objects.count(), 3)
+
     def test_run_checks_notifications(self):
-        # Create asset that needs service reminder
-        Asset.objects.create(
-            name="Service Due Soon",
-            service_time=self.now + timedelta(minutes=10),
-            expiration_time=self.now + timedelta(days=1)
+        result = self.run_checks()
+        self.assertEqual(
+            self.created_types(result, 'notifications', 'Service Due Soon'), ['service']
         )
-        
-        response = self.client.post('/api/run-checks/')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['notifications_created'], 1)
-        self.assertEqual(Notification.objects.count(), 1)
+        self.assertEqual(Notification.objects.filter(asset__name='Service Due Soon').count(), 1)
 
     def test_run_checks_violations(self):
-        # Create overdue asset
-        Asset.objects.create(
-            name="Overdue Asset",
-            service_time=self.now - timedelta(hours=1),
-            expiration_time=self.now + timedelta(days=1)
+        result = self.run_checks()
+        self.assertEqual(
+            self.created_types(result, 'violations', 'Overdue Asset'), ['not_serviced']
         )
-        
-        response = self.client.post('/api/run-checks/')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['violations_created'], 1)
-        self.assertEqual(Violation.objects.count(), 1)
+        self.assertEqual(Violation.objects.filter(asset__name='Overdue Asset').count(), 1)
+
+    def test_run_checks_details(self):
+        """Test the per-item details returned by run checks"""
+        result = self.run_checks()
+        self.assertEqual(self.created_types(result, 'notifications', 'Overdue Asset'), [])
+        violation = next(
+            item for item in result['details']['violations']
+            if item['asset'] == 'Overdue Asset'
+        )
+        self.assertEqual(violation['type'], 'not_serviced')
+        self.assertIn('due_time', violation)
+        self.assertNotIn('expired_time', violation)
 
     def test_run_checks_no_actions_needed(self):
         """Test run checks when no actions are needed"""
-        # Create asset with future times
-        Asset.objects.create(
-            name="Future Asset",
-            service_time=self.now + timedelta(days=1),
-            expiration_time=self.now + timedelta(days=2)
+        # Leave only the scenario with nothing due
+        Asset.objects.exclude(name='Future Asset').delete()
+        result = self.run_checks()
+        self.assertEqual(result['notifications_created'], 0)
+        self.assertEqual(result['violations_created'], 0)
+        self.assertEqual(
+            result['message'], 'Check completed. Created 0 notifications and 0 violations.'
         )
-        
-        response = self.client.post('/api/run-checks/')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['notifications_created'], 0)
-        self.assertEqual(response.data['violations_created'], 0)
+        self.assertFalse(Notification.objects.exists())
+        self.assertFalse(Violation.objects.exists())
 
     def test_run_checks_duplicate_prevention(self):
         """Test that duplicate notifications/violations are not created"""
-        # Create asset that needs service reminder
-        Asset.objects.create(
-            name="Service Due Soon",
-            service_time=self.now + timedelta(minutes=10),
-            expiration_time=self.now + timedelta(days=1)
-        )
-        
         # First run
-        response1 = self.client.post('/api/run-checks/')
-        self.assertEqual(response1.data['notifications_created'], 1)
+        result1 = self.run_checks()
+        self.assertEqual(result1['notifications_created'], 2)
+        self.assertEqual(result1['violations_created'], 3)
         
         # Second run - should not create duplicates
-        response2 = self.client.post('/api/run-checks/')
-        self.assertEqual(response2.data['notifications_created'], 0)
+        result2 = self.run_checks()
+        self.assertEqual(result2['notifications_created'], 0)
+        self.assertEqual(result2['violations_created'], 0)
         
-        # Total notifications should still be 1
-        self.assertEqual(Notification.objects.count(), 1)
-
-    def test_run_checks_edge_case_exactly_15_minutes(self):
-        """Test asset exactly 15 minutes before service time"""
-        Asset.objects.create(
-            name="Exactly 15 Min Asset",
-            service_time=self.now + timedelta(minutes=15),
-            expiration_time=self.now + timedelta(days=1)
-        )
-        
-        response = self.client.post('/api/run-checks/')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['notifications_created'], 1)
-
-    def test_run_checks_edge_case_just_over_15_minutes(self):
-        """Test asset just over 15 minutes before service time"""
-        Asset.objects.create(
-            name="Over 15 Min Asset",
-            service_time=self.now + timedelta(minutes=16),
-            expiration_time=self.now + timedelta(days=1)
-        )
-        
-        response = self.client.post('/api/run-checks/')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['notifications_created'], 0)
+        # Totals should be unchanged
+        self.assertEqual(Notification.objects.count(), 2)
+        self.assertEqual(Violation.objects.count(), 3)
+
+    def test_run_checks_details_capped(self):
+        """Test that details are capped while the counts stay exact"""
+        with patch('assets.services.DETAILS_CAP', 1):
+            result = self.run_checks()
+        self.assertEqual(result['notifications_created'], 2)
+        self.assertEqual(result['violations_created'], 3)
+        self.assertEqual(len(result['details']['notifications']), 1)
+        self.assertEqual(len(result['details']['violations']), 1)
+
+    def test_run_checks_refreshes_existing_reminder(self):
+        """Test that a repeated run re-sends an existing reminder"""
+        self.run_checks()
+        first_sent_at = Notification.objects.get(asset__name='Service Due Soon').sent_at
+
+        later = self.now + timedelta(minutes=1)
+        with patch.object(timezone, 'now', return_value=later):
+            self.run_checks()
+        notification = Notification.objects.get(asset__name='Service Due Soon')
+        self.assertEqual(notification.sent_at, later)
+        self.assertGreater(notification.sent_at, first_sent_at)
+
+    def test_run_checks_reminder_boundary(self):
+        """Test the 15 minute reminder window is inclusive at its edge"""
+        result = self.run_checks()
+        for asset_name, expected in [
+            ('Exactly 15 Min Asset', ['service']),
+            ('Over 15 Min Asset', []),
+        ]:
+            with self.subTest(asset_name):
+                self.assertEqual(
+                    self.created_types(result, 'notifications', asset_name), expected
+                )
 
     def test_run_checks_serviced_asset_no_violation(self):
         """Test that serviced assets don't create violations"""
-        Asset.objects.create(
-            name="Serviced Overdue Asset",
-            service_time=self.now - timedelta(hours=1),
-            expiration_time=self.now + timedelta(days=1),
-            is_serviced=True
-        )
-        
-        response = self.client.post('/api/run-checks/')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['violations_created'], 0)
+        result = self.run_checks()
+        self.assertEqual(self.created_types(result, 'violations', 'Serviced Overdue Asset'), [])
 
     def test_run_checks_both_notifications_and_violations(self):
         """Test creating both notifications and violations in one run"""
-        # Asset needing service reminder
-        Asset.objects.create(
-            name="Service Due Soon",
-            service_time=self.now + timedelta(minutes=10),
-            expiration_time=self.now + timedelta(days=1)
-        )
-        
-        # Overdue asset
+        # Savepoint, one asset scan, then an existing-rows lookup and a
+        # bulk insert for each kind, and the savepoint release; the count
+        # does not grow with the number of assets
+        with self.assertNumQueries(7):
+            result = self.run_checks()
+        # Service reminders for the 10 and 15 minute assets
+        self.assertEqual(result['notifications_created'], 2)
+        # The expired asset was never serviced, so it gets both violations
+        self.assertEqual(
+            self.created_types(result, 'violations', 'Expired Asset'), ['expired', 'not_serviced']
+        )
+        self.assertEqual(result['violations_created'], 3)
+
+    def test_run_checks_with_mocked_time(self):
+        """Test that the endpoint checks against the current (frozen) time"""
         Asset.objects.create(
-            name="Overdue Asset",
-            service_time=self.now - timedelta(hours=1),
-            expiration_time=self.now + timedelta(days=1)
-        )
-        
-        # Expired asset
-        Asset.objects.create(
-            name="Expired Asset",
-            service_time=self.now - timedelta(hours=2),
-            expiration_time=self.now - timedelta(hours=1)
+            name="Mock Time Asset",
+            service_time=self.FROZEN_NOW + TEN_MIN,
+            expiration_time=self.FROZEN_NOW + ONE_DAY
         )
         
-        response = self.client.post('/api/run-checks/')
+        response = self.client.post(reverse('run-checks'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['notifications_created'], 1)
-        self.assertEqual(response.data['violations_created'], 2)
-
-    @patch('assets.views.timezone.now')
-    def test_run_checks_with_mocked_time(self, mock_now):
-        """Test run checks with mocked current time"""
-        fixed_time = timezone.now()
-        mock_now.return_value = fixed_time
-        
-        Asset.objects.create(
-            name="Mock Time Asset",
-            service_time=fixed_time + timedelta(minutes=10),
-            expiration_time=fixed_time + timedelta(days=1)
+        # The fixture's two service reminders plus this asset's
+        self.assertEqual(response.data['notifications_created'], 3)
+        self.assertEqual(
+            self.created_types(response.data, 'notifications', 'Mock Time Asset'), ['service']
         )
+
+class EdgeCaseTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.now = timezone.now()
+
+    def test_pagination_with_many_assets(self):
+        """Test pagination with many assets"""
+        # Create 25 assets (more than the page size of 20) in one INSERT,
+        # inside an explicit atomic block so it is one unit of work
+        with transaction.atomic():
+            Asset.objects.bulk_create([
+                Asset(
+                    name=f"Asset {i}",
+                    service_time=self.now + timedelta(hours=i+1),
+                    expiration_time=self.now + timedelta(days=i+1)
+                )
+                for i in range(25)
+            ], batch_size=100)
         
-        response = self.client.post('/api/run-checks/')
+        response = self.client.get(reverse('asset-list'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['notifications_created'], 1)
+        self.assertEqual(len(response.data['results']), 20)
+        self.assertIsNotNone(response.data['next'])
+
+class EdgeCaseValidationTestCase(SimpleTestCase):
+    """Edge-case requests rejected before any database access"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.now = timezone.now()
 
-class EdgeCaseTestCase(APITestCase):
     def test_asset_with_same_service_and_expiration_time(self):
         """Test asset with same service and expiration time (should fail)"""
-        same_time = timezone.now() + timedelta(hours=1)
+        same_time = self.now + ONE_HOUR
         data = {
             'name': 'Same Time Asset',
             'service_time': same_time.isoformat(),
             'expiration_time': same_time.isoformat()
         }
-        response = self.client.post('/api/assets/', data, format='json')
+        response = post_asset(data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_asset_with_very_long_name(self):
@@ -566,53 +891,18 @@ class EdgeCaseTestCase(APITestCase):
         long_name = 'A' * 201  # Exceeds max_length of 200
         data = {
             'name': long_name,
-            'service_time': (timezone.now() + timedelta(hours=1)).isoformat(),
-            'expiration_time': (timezone.now() + timedelta(days=1)).isoformat()
+            'service_time': (self.now + ONE_HOUR).isoformat(),
+            'expiration_time': (self.now + ONE_DAY).isoformat()
         }
-        response = self.client.post('/api/assets/', data, format='json')
+        response = post_asset(data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-    def test_pagination_with_many_assets(self):
-        """Test pagination with many assets"""
-        # Create 25 assets (more than default page size of 20)
-        for i in range(25):
-            Asset.objects.create(
-                name=f"Asset {i}",
-                service_time=timezone.now() + timedelta(hours=i+1),
-                expiration_time=timezone.now() + timedelta(days=i+1)
-            )
-        
-        response = self.client.get('/api/assets/')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 20)
-        self.assertIsNotNone(response.data['next'])
-
     def test_invalid_http_methods(self):
         """Test invalid HTTP methods on endpoints"""
         # Try POST on detail endpoint (should be PUT/PATCH)
-        response = self.client.post('/api/assets/1/')
+        response = self.client.post(reverse('asset-detail', args=[1]))
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
         
         # Try DELETE on run-checks (should be POST)
-        response = self.client.delete('/api/run-checks/')
-        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
-
-    def test_concurrent_run_checks(self):
-        """Test concurrent run checks calls"""
-        Asset.objects.create(
-            name="Concurrent Test Asset",
-            service_time=timezone.now() + timedelta(minutes=10),
-            expiration_time=timezone.now() + timedelta(days=1)
-        )
-        
-        # Simulate concurrent calls
-        response1 = self.client.post('/api/run-checks/')
-        response2 = self.client.post('/api/run-checks/')
-        
-        # Both should succeed, but only one should create notification
-        self.assertEqual(response1.status_code, status.HTTP_200_OK)
-        self.assertEqual(response2.status_code, status.HTTP_200_OK)
-        
-        total_notifications = response1.data['notifications_created'] + response2.data['notifications_created']
-        self.assertEqual(total_notifications, 1)
-        self.assertEqual(Notification.objects.count(), 1)
\ No newline at end of file
+        response = self.client.delete(reverse('run-checks'))
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
\ No newline at end of file
@@ -1,22 +1,79 @@
 import logging
-from datetime import timedelta
+from functools import cached_property
 
-from django.db import transaction
+from django.db.models import (BooleanField, Count, ExpressionWrapper, OuterRef,
+                              Q, Subquery)
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status, viewsets
 from rest_framework.decorators import action, api_view
 from rest_framework.response import Response
 
+from .filters import AssetTypeFilterBackend
 from .models import Asset, Notification, Violation
+from .pagination import AssetCursorPagination
 from .serializers import (AssetSerializer, CheckResultSerializer,
                           NotificationSerializer, ViolationSerializer)
+from .services import perform_checks
 
 logger = logging.getLogger(__name__)
 
+
+def _count_for_asset(model):
+    # A correlated count per returned row; a JOIN with GROUP BY would have to
+    # aggregate every asset before the page LIMIT applies
+    counts = (
+        model.objects.filter(asset=OuterRef('pk'))
+        .order_by()
+        .values('asset')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
 class AssetViewSet(viewsets.ModelViewSet):
     queryset = Asset.objects.all()
     serializer_class = AssetSerializer
+    pagination_class = AssetCursorPagination
+
+    @cached_property
+    def now(self):
+        # One timestamp per request keeps every row of a response consistent
+        return timezone.now()
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['now'] = self.now
+        return context
+
+    def get_queryset(self):
+        queryset = super().get_queryset().annotate(
+            notifications_count=_count_for_asset(Notification),
+            violations_count=_count_for_asset(Violation),
+        )
+        if self.action == 'list':
+            # Plain comparisons on the raw columns keep the time indexes usable
+            now = self.now
+            queryset = queryset.annotate(
+                is_expired_db=ExpressionWrapper(
+                    Q(expiration_time__lt=now),
+                    output_field=BooleanField()
+                ),
+                is_service_overdue_db=ExpressionWrapper(
+                    Q(service_time__lt=now) & Q(is_serviced=False),
+                    output_field=BooleanField()
+                ),
+            )
+        return queryset
+
+    def perform_create(self, serializer):
+        asset = serializer.save()
+        # A new asset has no notifications or violations yet; set the counts
+        # so the create response has the same shape without COUNT queries
+        asset.notifications_count = 0
+        asset.violations_count = 0
     
     @swagger_auto_schema(
         operation_description="Mark an asset as serviced",
@@ -26,45 +83,26 @@ class AssetViewSet(viewsets.ModelViewSet):
     def mark_serviced(self, request, pk=None):
         asset = self.get_object()
         asset.is_serviced = True
-        asset.save()
+        # Write only the changed columns rather than the whole row
+        asset.save(update_fields=['is_serviced', 'updated_at'])
         return Response({
             'message': f'Asset {asset.name} marked as serviced',
-            'asset': AssetSerializer(asset).data
+            'asset': self.get_serializer(asset).data
         })
 
 
 class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Notification.objects.all()
     serializer_class = NotificationSerializer
-    
-    def get_queryset(self):
-        queryset = Notification.objects.all()
-        asset_id = self.request.query_params.get('asset', None)
-        notification_type = self.request.query_params.get('type', None)
-        
-        if asset_id is not None:
-            queryset = queryset.filter(asset=asset_id)
-        if notification_type is not None:
-            queryset = queryset.filter(notification_type=notification_type)
-            
-        return queryset
+    filter_backends = [AssetTypeFilterBackend]
+    type_field = 'notification_type'
 
 
 class ViolationViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Violation.objects.all()
     serializer_class = ViolationSerializer
-    
-    def get_queryset(self):
-        queryset = Violation.objects.all()
-        asset_id = self.request.query_params.get('asset', None)
-        violation_type = self.request.query_params.get('type', None)
-        
-        if asset_id is not None:
-            queryset = queryset.filter(asset=asset_id)
-        if violation_type is not None:
-            queryset = queryset.filter(violation_type=violation_type)
-            
-        return queryset
+    filter_backends = [AssetTypeFilterBackend]
+    type_field = 'violation_type'
 
 
 @swagger_auto_schema(
@@ -86,106 +124,12 @@ def run_checks(request):
     3. Creates violations for overdue assets
     """
     try:
-        with transaction.atomic():
-            now = timezone.now()
-            reminder_threshold = now + timedelta(minutes=15)
-            
-            notifications_created = 0
-            violations_created = 0
-            details = {
-                'notifications': [],
-                'violations': []
-            }
-            
-            # Get all assets that might need checking
-            assets = Asset.objects.all()
-            
-            for asset in assets:
-                # Check for service reminders (15 minutes before service time)
-                if (asset.service_time > now and 
-                    asset.service_time <= reminder_threshold and 
-                    not asset.is_serviced):
-                    
-                    notification, created = Notification.objects.get_or_create(
-                        asset=asset,
-                        notification_type='service',
-                        defaults={
-                            'message': f'Service reminder: Asset "{asset.name}" needs service at {asset.service_time}'
-                        }
-                    )
-                    if created:
-                        notifications_created += 1
-                        details['notifications'].append({
-                            'asset': asset.name,
-                            'type': 'service',
-                            'time': asset.service_time.isoformat()
-                        })
-                
-                # Check for expiration reminders (15 minutes before expiration)
-                if (asset.expiration_time > now and 
-                    asset.expiration_time <= reminder_threshold):
-                    
-                    notification, created = Notification.objects.get_or_create(
-                        asset=asset,
-                        notification_type='expiration',
-                        defaults={
-                            'message': f'Expiration reminder: Asset "{asset.name}" expires at {asset.expiration_time}'
-                        }
-                    )
-                    if created:
-                        notifications_created += 1
-                        details['notifications'].append({
-                            'asset': asset.name,
-                            'type': 'expiration',
-                            'time': asset.expiration_time.isoformat()
-                        })
-                
-                # Check for service violations (service time passed and not serviced)
-                if asset.service_time <= now and not asset.is_serviced:
-                    violation, created = Violation.objects.get_or_create(
-                        asset=asset,
-                        violation_type='not_serviced',
-                        defaults={
-                            'description': f'Service overdue: Asset "{asset.name}" was due for service at {asset.service_time}'
-                        }
-                    )
-                    if created:
-                        violations_created += 1
-                        details['violations'].append({
-                            'asset': asset.name,
-                            'type': 'not_serviced',
-                            'due_time': asset.service_time.isoformat()
-                        })
-                
-                # Check for expiration violations (expiration time passed)
-                if asset.expiration_time <= now:
-                    violation, created = Violation.objects.get_or_create(
-                        asset=asset,
-                        violation_type='expired',
-                        defaults={
-                            'description': f'Asset expired: Asset "{asset.name}" expired at {asset.expiration_time}'
-                        }
-                    )
-                    if created:
-                        violations_created += 1
-                        details['violations'].append({
-                            'asset': asset.name,
-                            'type': 'expired',
-                            'expired_time': asset.expiration_time.isoformat()
-                        })
-            
-            result_data = {
-                'notifications_created': notifications_created,
-                'violations_created': violations_created,
-                'message': f'Check completed. Created {notifications_created} notifications and {violations_created} violations.',
-                'details': details
-            }
-            
-            serializer = CheckResultSerializer(data=result_data)
-            serializer.is_valid(raise_exception=True)
-            logger.info('Run checks successfull.')
-            return Response(serializer.data, status=status.HTTP_200_OK)
-            
+        result_data = perform_checks(timezone.now())
+        # The result is built server-side, so it is only rendered, not validated
+        serializer = CheckResultSerializer(instance=result_data)
+        logger.info('Run checks successfull.')
+        return Response(serializer.data, status=status.HTTP_200_OK)
+        
     except Exception as error:
         logger.error(f'Error during running checks: {str(error)}')
         return Response(
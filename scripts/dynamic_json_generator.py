@@ -1,33 +1,57 @@
+import argparse
 import json
-from datetime import datetime, timedelta
+import sys
+from datetime import datetime, timedelta, timezone
 
-# Current UTC time
-now = datetime.utcnow()
+# orjson is optional: it is faster when generating many assets, and the
+# standard library produces the same output without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Asset definitions
+# Asset scenarios: name, description, service time and expiration time
+# relative to now, is_serviced
+SPECS = [
+    ("Asset Due Soon", "Asset needing service in 10 minutes",
+     timedelta(minutes=10), timedelta(days=1), False),
+    ("Overdue Asset", "Asset that missed service time",
+     timedelta(hours=-2), timedelta(days=1), False),
+    ("Expired Asset", "Asset that has expired",
+     timedelta(hours=-2), timedelta(hours=-1), False),
+]
+
+parser = argparse.ArgumentParser(description="Print asset JSON for the API")
+parser.add_argument(
+    "--count", type=int, default=1,
+    help="copies of each scenario to generate, e.g. for load testing run-checks"
+)
+args = parser.parse_args()
+
+# Current UTC time, to the second: whole seconds format without a
+# microsecond part, and every asset time derives from this one value
+now = datetime.now(timezone.utc).replace(microsecond=0)
+
+# Names only get a copy number when there is more than one of each
 assets = [
     {
-        "name": "Asset Due Soon",
-        "description": "Asset needing service in 10 minutes",
-        "service_time": (now + timedelta(minutes=10)).isoformat() + "Z",
-        "expiration_time": (now + timedelta(days=1)).isoformat() + "Z",
-        "is_serviced": False
-    },
-    {
-        "name": "Overdue Asset",
-        "description": "Asset that missed service time",
-        "service_time": (now - timedelta(hours=2)).isoformat() + "Z",
-        "expiration_time": (now + timedelta(days=1)).isoformat() + "Z",
-        "is_serviced": False
-    },
-    {
-        "name": "Expired Asset",
-        "description": "Asset that has expired",
-        "service_time": (now - timedelta(hours=2)).isoformat() + "Z",
-        "expiration_time": (now - timedelta(hours=1)).isoformat() + "Z",
-        "is_serviced": False
+        "name": f"{name} {i}" if args.count > 1 else name,
+        "description": description,
+        "service_time": now + service_delta,
+        "expiration_time": now + expiration_delta,
+        "is_serviced": is_serviced
     }
+    for i in range(1, args.count + 1)
+    for name, description, service_delta, expiration_delta, is_serviced in SPECS
 ]
 
-# Pretty print the JSON
-print(json.dumps(assets, indent=2))
+# Pretty print the JSON, with times as UTC ISO 8601 strings ending in "Z"
+if orjson is not None:
+    sys.stdout.buffer.write(
+        orjson.dumps(assets, option=orjson.OPT_INDENT_2 | orjson.OPT_UTC_Z)
+        + b"\n"
+    )
+else:
+    print(json.dumps(
+        assets, indent=2, default=lambda value: value.isoformat().replace("+00:00", "Z")
+    ))
@@ -0,0 +1,2 @@
+# test.sh
+python manage.py test --parallel auto "$@"